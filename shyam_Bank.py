@@ -1,496 +1,812 @@
-import sqlite3
-import tkinter as tk
-from tkinter import ttk, messagebox
-from datetime import datetime
-
-DB_FILE = "bank.db"
-ADMIN_PASSWORD = "shyam123"   # <-- set your own secure password here
-
-
-# --------------------------
-# Database layer (CRUD)
-# -------------------------
-class BankDB:
-    def __init__(self, db_file=DB_FILE):
-        self.conn = sqlite3.connect(db_file)
-        self.conn.execute("PRAGMA foreign_keys = ON;")
-        self.create_schema()
-
-    def create_schema(self):
-        cur = self.conn.cursor()
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS accounts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            balance REAL NOT NULL DEFAULT 0,
-            created_at TEXT NOT NULL
-        );
-        """)
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS transactions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            account_id INTEGER NOT NULL,
-            type TEXT NOT NULL, -- "DEPOSIT", "WITHDRAW", "TRANSFER_IN", "TRANSFER_OUT"
-            amount REAL NOT NULL,
-            timestamp TEXT NOT NULL,
-            note TEXT,
-            related_account_id INTEGER,
-            FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE
-        );
-        """)
-        self.conn.commit()
-
-    # --- Account operations ---
-    def create_account(self, name: str, initial_balance: float = 0.0):
-        if not name.strip():
-            raise ValueError("Account name cannot be empty.")
-        if initial_balance < 0:
-            raise ValueError("Initial balance cannot be negative.")
-        ts = datetime.now().isoformat(timespec="seconds")
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO accounts (name, balance, created_at) VALUES (?,?,?)",
-            (name.strip(), float(initial_balance), ts)
-        )
-        acc_id = cur.lastrowid
-        if initial_balance > 0:
-            self._add_tx(acc_id, "DEPOSIT", float(initial_balance), "Initial deposit")
-        self.conn.commit()
-        return acc_id
-
-    def get_account(self, account_id: int):
-        cur = self.conn.cursor()
-        cur.execute("SELECT id, name, balance, created_at FROM accounts WHERE id = ?", (account_id,))
-        return cur.fetchone()
-
-    def search_accounts(self, query: str = ""):
-        cur = self.conn.cursor()
-        q = f"%{query.strip()}%"
-        cur.execute("""
-            SELECT id, name, balance, created_at
-            FROM accounts
-            WHERE name LIKE ? OR CAST(id AS TEXT) LIKE ?
-            ORDER BY id ASC
-        """, (q, q))
-        return cur.fetchall()
-
-    def delete_account(self, account_id: int):
-        # Prevent deleting account that still has money (optional business rule)
-        acc = self.get_account(account_id)
-        if not acc:
-            raise ValueError("Account not found.")
-        if acc[2] != 0:
-            raise ValueError("Cannot delete account with non-zero balance. Please withdraw/transfer first.")
-        cur = self.conn.cursor()
-        cur.execute("DELETE FROM accounts WHERE id = ?", (account_id,))
-        self.conn.commit()
-
-    # --- Transaction operations ---
-    def deposit(self, account_id: int, amount: float, note: str = ""):
-        if amount <= 0:
-            raise ValueError("Deposit amount must be positive.")
-        acc = self.get_account(account_id)
-        if not acc:
-            raise ValueError("Account not found.")
-        new_balance = acc[2] + amount
-        cur = self.conn.cursor()
-        cur.execute("UPDATE accounts SET balance = ? WHERE id = ?", (new_balance, account_id))
-        self._add_tx(account_id, "DEPOSIT", amount, note)
-        self.conn.commit()
-        return new_balance
-
-    def withdraw(self, account_id: int, amount: float, note: str = ""):
-        if amount <= 0:
-            raise ValueError("Withdrawal amount must be positive.")
-        acc = self.get_account(account_id)
-        if not acc:
-            raise ValueError("Account not found.")
-        if acc[2] < amount:
-            raise ValueError("Insufficient balance.")
-        new_balance = acc[2] - amount
-        cur = self.conn.cursor()
-        cur.execute("UPDATE accounts SET balance = ? WHERE id = ?", (new_balance, account_id))
-        self._add_tx(account_id, "WITHDRAW", amount, note)
-        self.conn.commit()
-        return new_balance
-
-    def transfer(self, from_id: int, to_id: int, amount: float, note: str = ""):
-        if from_id == to_id:
-            raise ValueError("Cannot transfer to the same account.")
-        if amount <= 0:
-            raise ValueError("Transfer amount must be positive.")
-        acc_from = self.get_account(from_id)
-        acc_to = self.get_account(to_id)
-        if not acc_from or not acc_to:
-            raise ValueError("Source or destination account not found.")
-        if acc_from[2] < amount:
-            raise ValueError("Insufficient balance in source account.")
-
-        cur = self.conn.cursor()
-        # Update balances
-        new_from_balance = acc_from[2] - amount
-        new_to_balance = acc_to[2] + amount
-        cur.execute("UPDATE accounts SET balance = ? WHERE id = ?", (new_from_balance, from_id))
-        cur.execute("UPDATE accounts SET balance = ? WHERE id = ?", (new_to_balance, to_id))
-
-        # Add paired transactions
-        self._add_tx(from_id, "TRANSFER_OUT", amount, note, related_account_id=to_id)
-        self._add_tx(to_id, "TRANSFER_IN", amount, note, related_account_id=from_id)
-        self.conn.commit()
-        return new_from_balance, new_to_balance
-
-    def list_transactions(self, account_id: int, limit: int = 50):
-        cur = self.conn.cursor()
-        cur.execute("""
-            SELECT id, type, amount, timestamp, note, related_account_id
-            FROM transactions
-            WHERE account_id = ?
-            ORDER BY id DESC
-            LIMIT ?
-        """, (account_id, limit))
-        return cur.fetchall()
-
-    def _add_tx(self, account_id: int, tx_type: str, amount: float, note: str = "", related_account_id: int | None = None):
-        ts = datetime.now().isoformat(timespec="seconds")
-        cur = self.conn.cursor()
-        cur.execute("""
-            INSERT INTO transactions (account_id, type, amount, timestamp, note, related_account_id)
-            VALUES (?,?,?,?,?,?)
-        """, (account_id, tx_type, float(amount), ts, note.strip() if note else None, related_account_id))
-
-
-# --------------------------
-# GUI layer
-# --------------------------
-class BankApp(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Shyam Capital & Finance")
-        self.geometry("960x640")
-        self.db = BankDB()
-
-        # Notebook (tabs)
-        self.notebook = ttk.Notebook(self)
-        self.notebook.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
-
-        self.accounts_tab = ttk.Frame(self.notebook)
-        self.deposit_tab = ttk.Frame(self.notebook)
-        self.withdraw_tab = ttk.Frame(self.notebook)
-        self.transfer_tab = ttk.Frame(self.notebook)
-        self.transactions_tab = ttk.Frame(self.notebook)
-        self.admin_tab = ttk.Frame(self.notebook)
-
-        self.notebook.add(self.accounts_tab, text="Accounts")
-        self.notebook.add(self.deposit_tab, text="Deposit")
-        self.notebook.add(self.withdraw_tab, text="Withdraw")
-        self.notebook.add(self.transfer_tab, text="Transfer")
-        self.notebook.add(self.transactions_tab, text="Transactions")
-
-        # Admin tab is NOT added yet until password is entered
-        self.admin_unlocked = False
-
-        # Build tabs
-        self._setup_accounts_tab()
-        self._setup_deposit_tab()
-        self._setup_withdraw_tab()
-        self._setup_transfer_tab()
-        self._setup_transactions_tab()
-
-        # Status bar
-        self.status_var = tk.StringVar(value="Ready.")
-        self.status_label = tk.Label(self, textvariable=self.status_var, anchor="w",
-                                     relief="sunken", bg="#f0f0f0", padx=8)
-        self.status_label.pack(fill=tk.X, side=tk.BOTTOM)
-
-        # Admin login frame
-        self._setup_admin_login()
-
-    # ---------------- Status utilities ----------------
-    def set_status(self, msg, status="info"):
-        colors = {"info": "#f0f0f0", "success": "#d6f5d6", "warning": "#ffe8b3", "error": "#f9c2c2"}
-        self.status_var.set(msg)
-        self.status_label.config(bg=colors.get(status, "#f0f0f0"))
-
-    # ---------------- Admin Login ----------------
-    def _setup_admin_login(self):
-        login_frame = ttk.LabelFrame(self, text="Admin Login")
-        login_frame.pack(fill=tk.X, padx=8, pady=8)
-
-        ttk.Label(login_frame, text="Enter Admin Password:").grid(row=0, column=0, padx=6, pady=6)
-        self.admin_pass_var = tk.StringVar()
-        ttk.Entry(login_frame, textvariable=self.admin_pass_var, show="*").grid(row=0, column=1, padx=6, pady=6)
-        ttk.Button(login_frame, text="Unlock Admin", command=self.unlock_admin).grid(row=0, column=2, padx=6, pady=6)
-
-    def unlock_admin(self):
-        if self.admin_pass_var.get() == ADMIN_PASSWORD:
-            if not self.admin_unlocked:
-                self.notebook.add(self.admin_tab, text="Admin")
-                self._setup_admin_tab()
-                self.admin_unlocked = True
-                self.set_status("Admin tab unlocked successfully.", "success")
-        else:
-            self.set_status("Incorrect password. Access denied.", "error")
-
-
-    # ---------------- Accounts Tab ----------------
-    def _setup_accounts_tab(self):
-        frm = self.accounts_tab
-
-        # Create account
-        create_frame = ttk.LabelFrame(frm, text="Create account")
-        create_frame.pack(fill=tk.X, padx=8, pady=8)
-
-        ttk.Label(create_frame, text="Name:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
-        self.acc_name_var = tk.StringVar()
-        ttk.Entry(create_frame, textvariable=self.acc_name_var, width=30).grid(row=0, column=1, padx=6, pady=6)
-
-        ttk.Label(create_frame, text="Initial balance:").grid(row=0, column=2, padx=6, pady=6, sticky="w")
-        self.acc_init_var = tk.StringVar(value="0")
-        ttk.Entry(create_frame, textvariable=self.acc_init_var, width=15).grid(row=0, column=3, padx=6, pady=6)
-
-        ttk.Button(create_frame, text="Create", command=self.create_account).grid(row=0, column=4, padx=6, pady=6)
-
-        # Search and list
-        list_frame = ttk.LabelFrame(frm, text="Accounts list")
-        list_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
-
-        top_bar = tk.Frame(list_frame)
-        top_bar.pack(fill=tk.X, padx=6, pady=4)
-        ttk.Label(top_bar, text="Search:").pack(side=tk.LEFT, padx=4)
-        self.search_var = tk.StringVar()
-        ttk.Entry(top_bar, textvariable=self.search_var, width=30).pack(side=tk.LEFT, padx=4)
-        ttk.Button(top_bar, text="Find", command=self.refresh_accounts).pack(side=tk.LEFT, padx=4)
-        ttk.Button(top_bar, text="Refresh", command=lambda: self.refresh_accounts(True)).pack(side=tk.LEFT, padx=4)
-
-        columns = ("id", "name", "balance", "created_at")
-        self.accounts_tree = ttk.Treeview(list_frame, columns=columns, show="headings", height=12)
-        for col, text, w in [
-            ("id", "ID", 80),
-            ("name", "Name", 240),
-            ("balance", "Balance", 140),
-            ("created_at", "Created at", 200),
-        ]:
-            self.accounts_tree.heading(col, text=text)
-            self.accounts_tree.column(col, width=w, anchor=tk.CENTER)
-        self.accounts_tree.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
-
-        self.refresh_accounts(True)
-
-    def create_account(self):
-        name = self.acc_name_var.get().strip()
-        initial = self.acc_init_var.get().strip()
-        try:
-            initial_value = float(initial) if initial else 0.0
-            acc_id = self.db.create_account(name, initial_value)
-            messagebox.showinfo("Success", f"Account created (ID: {acc_id})")
-            self.acc_name_var.set("")
-            self.acc_init_var.set("0")
-            self.refresh_accounts(True)
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
-
-    def refresh_accounts(self, clear_search=False):
-        if clear_search:
-            self.search_var.set("")
-        query = self.search_var.get().strip()
-        rows = self.db.search_accounts(query)
-        for i in self.accounts_tree.get_children():
-            self.accounts_tree.delete(i)
-        for r in rows:
-            self.accounts_tree.insert("", tk.END, values=r)
-
-    # ---------------- Deposit Tab ----------------
-    def _setup_deposit_tab(self):
-        frm = self.deposit_tab
-        box = ttk.LabelFrame(frm, text="Deposit")
-        box.pack(fill=tk.X, padx=8, pady=8)
-
-        self.dep_acc_var = tk.StringVar()
-        self.dep_amt_var = tk.StringVar()
-        self.dep_note_var = tk.StringVar()
-
-        ttk.Label(box, text="Account ID:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
-        ttk.Entry(box, textvariable=self.dep_acc_var, width=12).grid(row=0, column=1, padx=6, pady=6)
-        ttk.Label(box, text="Amount:").grid(row=0, column=2, padx=6, pady=6, sticky="w")
-        ttk.Entry(box, textvariable=self.dep_amt_var, width=12).grid(row=0, column=3, padx=6, pady=6)
-        ttk.Label(box, text="Note:").grid(row=0, column=4, padx=6, pady=6, sticky="w")
-        ttk.Entry(box, textvariable=self.dep_note_var, width=30).grid(row=0, column=5, padx=6, pady=6)
-
-        ttk.Button(box, text="Deposit", command=self.do_deposit).grid(row=0, column=6, padx=8, pady=6)
-
-    def do_deposit(self):
-        try:
-            acc_id = int(self.dep_acc_var.get())
-            amt = float(self.dep_amt_var.get())
-            note = self.dep_note_var.get()
-            new_bal = self.db.deposit(acc_id, amt, note)
-            messagebox.showinfo("Success", f"Deposited {amt:.2f}. New balance: {new_bal:.2f}")
-            self.dep_amt_var.set("")
-            self.dep_note_var.set("")
-            self.refresh_accounts(True)
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
-
-    # ---------------- Withdraw Tab ----------------
-    def _setup_withdraw_tab(self):
-        frm = self.withdraw_tab
-        box = ttk.LabelFrame(frm, text="Withdraw")
-        box.pack(fill=tk.X, padx=8, pady=8)
-
-        self.wd_acc_var = tk.StringVar()
-        self.wd_amt_var = tk.StringVar()
-        self.wd_note_var = tk.StringVar()
-
-        ttk.Label(box, text="Account ID:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
-        ttk.Entry(box, textvariable=self.wd_acc_var, width=12).grid(row=0, column=1, padx=6, pady=6)
-        ttk.Label(box, text="Amount:").grid(row=0, column=2, padx=6, pady=6, sticky="w")
-        ttk.Entry(box, textvariable=self.wd_amt_var, width=12).grid(row=0, column=3, padx=6, pady=6)
-        ttk.Label(box, text="Note:").grid(row=0, column=4, padx=6, pady=6, sticky="w")
-        ttk.Entry(box, textvariable=self.wd_note_var, width=30).grid(row=0, column=5, padx=6, pady=6)
-
-        ttk.Button(box, text="Withdraw", command=self.do_withdraw).grid(row=0, column=6, padx=8, pady=6)
-
-    def do_withdraw(self):
-        try:
-            acc_id = int(self.wd_acc_var.get())
-            amt = float(self.wd_amt_var.get())
-            note = self.wd_note_var.get()
-            new_bal = self.db.withdraw(acc_id, amt, note)
-            messagebox.showinfo("Success", f"Withdrew {amt:.2f}. New balance: {new_bal:.2f}")
-            self.wd_amt_var.set("")
-            self.wd_note_var.set("")
-            self.refresh_accounts(True)
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
-
-    # ---------------- Transfer Tab ----------------
-    def _setup_transfer_tab(self):
-        frm = self.transfer_tab
-        box = ttk.LabelFrame(frm, text="Transfer")
-        box.pack(fill=tk.X, padx=8, pady=8)
-
-        self.tf_from_var = tk.StringVar()
-        self.tf_to_var = tk.StringVar()
-        self.tf_amt_var = tk.StringVar()
-        self.tf_note_var = tk.StringVar()
-
-        ttk.Label(box, text="From Account ID:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
-        ttk.Entry(box, textvariable=self.tf_from_var, width=12).grid(row=0, column=1, padx=6, pady=6)
-        ttk.Label(box, text="To Account ID:").grid(row=0, column=2, padx=6, pady=6, sticky="w")
-        ttk.Entry(box, textvariable=self.tf_to_var, width=12).grid(row=0, column=3, padx=6, pady=6)
-        ttk.Label(box, text="Amount:").grid(row=0, column=4, padx=6, pady=6, sticky="w")
-        ttk.Entry(box, textvariable=self.tf_amt_var, width=12).grid(row=0, column=5, padx=6, pady=6)
-        ttk.Label(box, text="Note:").grid(row=0, column=6, padx=6, pady=6, sticky="w")
-        ttk.Entry(box, textvariable=self.tf_note_var, width=24).grid(row=0, column=7, padx=6, pady=6)
-
-        ttk.Button(box, text="Transfer", command=self.do_transfer).grid(row=0, column=8, padx=8, pady=6)
-
-    def do_transfer(self):
-        try:
-            from_id = int(self.tf_from_var.get())
-            to_id = int(self.tf_to_var.get())
-            amt = float(self.tf_amt_var.get())
-            note = self.tf_note_var.get()
-            new_from, new_to = self.db.transfer(from_id, to_id, amt, note)
-            messagebox.showinfo("Success", f"Transferred {amt:.2f}. From new balance: {new_from:.2f}, To new balance: {new_to:.2f}")
-            self.tf_amt_var.set("")
-            self.tf_note_var.set("")
-            self.refresh_accounts(True)
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
-
-    # ---------------- Transactions Tab ----------------
-    def _setup_transactions_tab(self):
-        frm = self.transactions_tab
-        box = ttk.LabelFrame(frm, text="Transaction history")
-        box.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
-
-        top = tk.Frame(box)
-        top.pack(fill=tk.X, padx=6, pady=6)
-
-        self.tx_acc_var = tk.StringVar()
-        self.tx_limit_var = tk.StringVar(value="50")
-
-        ttk.Label(top, text="Account ID:").pack(side=tk.LEFT, padx=4)
-        ttk.Entry(top, textvariable=self.tx_acc_var, width=12).pack(side=tk.LEFT, padx=4)
-        ttk.Label(top, text="Limit:").pack(side=tk.LEFT, padx=4)
-        ttk.Entry(top, textvariable=self.tx_limit_var, width=6).pack(side=tk.LEFT, padx=4)
-        ttk.Button(top, text="Load", command=self.load_transactions).pack(side=tk.LEFT, padx=6)
-
-        columns = ("id", "type", "amount", "timestamp", "note", "related")
-        self.tx_tree = ttk.Treeview(box, columns=columns, show="headings", height=16)
-        headings = [
-            ("id", "ID", 80),
-            ("type", "Type", 120),
-            ("amount", "Amount", 120),
-            ("timestamp", "Timestamp", 180),
-            ("note", "Note", 240),
-            ("related", "Related Acc", 120),
-        ]
-        for col, text, w in headings:
-            self.tx_tree.heading(col, text=text)
-            self.tx_tree.column(col, width=w, anchor=tk.CENTER)
-        self.tx_tree.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
-
-    def load_transactions(self):
-        try:
-            acc_id = int(self.tx_acc_var.get())
-            limit = int(self.tx_limit_var.get())
-            rows = self.db.list_transactions(acc_id, limit)
-            for i in self.tx_tree.get_children():
-                self.tx_tree.delete(i)
-            for r in rows:
-                self.tx_tree.insert("", tk.END, values=r)
-        except ValueError:
-            messagebox.showerror("Error", "Please enter valid Account ID and Limit.")
-
-    # ---------------- Admin Tab ----------------
-    def _setup_admin_tab(self):
-        frm = self.admin_tab
-        box = ttk.LabelFrame(frm, text="Admin operations")
-        box.pack(fill=tk.X, padx=8, pady=8)
-
-        self.del_acc_var = tk.StringVar()
-
-        ttk.Label(box, text="Delete Account ID:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
-        ttk.Entry(box, textvariable=self.del_acc_var, width=12).grid(row=0, column=1, padx=6, pady=6)
-        ttk.Button(box, text="Delete", command=self.delete_account).grid(row=0, column=2, padx=8, pady=6)
-
-        # Quick balances checker
-        bal_box = ttk.LabelFrame(frm, text="Quick balance check")
-        bal_box.pack(fill=tk.X, padx=8, pady=8)
-        self.bal_acc_var = tk.StringVar()
-        ttk.Label(bal_box, text="Account ID:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
-        ttk.Entry(bal_box, textvariable=self.bal_acc_var, width=12).grid(row=0, column=1, padx=6, pady=6)
-        ttk.Button(bal_box, text="Check", command=self.check_balance).grid(row=0, column=2, padx=8, pady=6)
-
-    def delete_account(self):
-        try:
-            acc_id = int(self.del_acc_var.get())
-            # Confirm
-            if messagebox.askyesno("Confirm", f"Delete account {acc_id}? (Requires zero balance)"):
-                self.db.delete_account(acc_id)
-                messagebox.showinfo("Deleted", f"Account {acc_id} deleted.")
-                self.del_acc_var.set("")
-                self.refresh_accounts(True)
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
-
-    def check_balance(self):
-        try:
-            acc_id = int(self.bal_acc_var.get())
-            acc = self.db.get_account(acc_id)
-            if not acc:
-                messagebox.showerror("Not found", "Account not found.")
-                return
-            messagebox.showinfo("Balance", f"Account {acc[0]} ({acc[1]}) balance: {acc[2]:.2f}")
-        except ValueError:
-            messagebox.showerror("Error", "Please enter a valid Account ID.")
-
-
-# --------------------------
-# Run app
-# --------------------------
-if __name__ == "__main__":
-    app = BankApp()
-    app.mainloop()
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import tkinter as tk
+from contextlib import contextmanager
+from tkinter import ttk, messagebox
+
+DB_FILE = "bank.db"
+ADMIN_PASSWORD = "shyam123"   # <-- set your own secure password here
+
+
+def to_cents(amount) -> int:
+    """Convert a dollar amount to integer cents at the DB boundary."""
+    return int(round(float(amount) * 100))
+
+
+def fmt_money(cents: int) -> str:
+    """Format integer cents as a dollar string for display."""
+    return f"{cents / 100:.2f}"
+
+
+# Hot-path SQL, defined once so sqlite3's statement cache keys on
+# stable strings and never re-parses these per GUI click. Invariant:
+# SQL is never built with f-strings or concatenation inside methods --
+# a fresh string per call would thrash the statement cache.
+_SQL = {
+    # Timestamps are computed by SQLite (see the column DEFAULTs);
+    # spelling strftime here keeps databases created before the
+    # DEFAULT existed working too.
+    "insert_account": """
+        INSERT INTO accounts (name, balance, created_at)
+        VALUES (?, ?, strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime'))
+        RETURNING id
+    """,
+    "get_account": "SELECT id, name, balance, created_at FROM accounts WHERE id = ?",
+    # UNION of an exact-id lookup and an FTS5 name match (prefix
+    # query), so both arms resolve through an index instead of the
+    # LIKE scan the old CAST(id AS TEXT) LIKE ? OR ... forced.
+    # Keyset-paginated: id > ? seeks straight to the page start, so
+    # page load cost is independent of table size (unlike OFFSET).
+    "search_accounts": """
+        SELECT id, name, balance, created_at FROM accounts WHERE id = ? AND id > ?
+        UNION
+        SELECT id, name, balance, created_at FROM accounts
+        WHERE id IN (SELECT rowid FROM accounts_fts WHERE accounts_fts MATCH ?) AND id > ?
+        ORDER BY id ASC
+        LIMIT ?
+    """,
+    "list_accounts": """
+        SELECT id, name, balance, created_at FROM accounts
+        WHERE id > ? ORDER BY id ASC LIMIT ?
+    """,
+    "delete_account": "DELETE FROM accounts WHERE id = ? AND balance = 0 RETURNING id",
+    "credit": "UPDATE accounts SET balance = balance + ? WHERE id = ? RETURNING balance",
+    "debit": "UPDATE accounts SET balance = balance - ? WHERE id = ? AND balance >= ? RETURNING balance",
+    "list_tx": """
+        SELECT id, type, amount, timestamp, note, related_account_id
+        FROM transactions
+        WHERE account_id = ?
+        ORDER BY id DESC
+        LIMIT ?
+    """,
+    "insert_tx": """
+        INSERT INTO transactions (account_id, type, amount, timestamp, note, related_account_id)
+        VALUES (?, ?, ?, strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime'), ?, ?)
+    """,
+    "stage_tx": """
+        INSERT OR REPLACE INTO tx_stage (account_id, type, amount, note, related_account_id)
+        VALUES (?,?,?,?,?)
+    """,
+}
+
+
+# --------------------------
+# Database layer (CRUD)
+# -------------------------
+class BankDB:
+    def __init__(self, db_file=DB_FILE):
+        # check_same_thread=False: the connections are created on the Tk
+        # thread but used only from the single DB worker thread, so there
+        # is never concurrent access.
+        # isolation_level=None: autocommit, no implicit DEFERRED
+        # transactions from the sqlite3 module -- write paths open their
+        # own BEGIN IMMEDIATE via _write_tx and reads need no transaction.
+        self.conn = sqlite3.connect(db_file, cached_statements=32,
+                                    check_same_thread=False, isolation_level=None)
+        self._tune(self.conn)
+        self.conn.execute("PRAGMA foreign_keys = ON;")
+        self.create_schema()
+        # Separate read-only connection for the query paths: under WAL a
+        # long scan on this handle never serializes against the writer.
+        self.ro = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True,
+                                  cached_statements=32, check_same_thread=False,
+                                  isolation_level=None)
+        self._tune(self.ro)
+
+    @staticmethod
+    def _tune(conn):
+        # WAL keeps readers from blocking the writer and turns each commit
+        # into an append instead of a full rollback-journal fsync.
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute("PRAGMA cache_size=-20000;")   # ~20 MB page cache
+        conn.execute("PRAGMA busy_timeout=5000;")
+        conn.execute("PRAGMA mmap_size=268435456;") # 256 MB
+
+    @contextmanager
+    def _write_tx(self):
+        # BEGIN IMMEDIATE takes the write lock up front instead of
+        # upgrading mid-transaction, so we never hit SQLITE_BUSY halfway.
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def create_schema(self):
+        # One atomic transaction covers schema creation and any migration.
+        with self._write_tx():
+            # Money is stored as integer cents: exact arithmetic (no binary
+            # float rounding) and smaller rows than 8-byte REALs.
+            legacy = self.conn.execute(
+                "SELECT 1 FROM pragma_table_info('accounts') WHERE name='balance' AND type='REAL'"
+            ).fetchone() is not None
+            if legacy:
+                self.conn.execute("ALTER TABLE accounts RENAME TO accounts_legacy;")
+                self.conn.execute("ALTER TABLE transactions RENAME TO transactions_legacy;")
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS accounts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                balance INTEGER NOT NULL DEFAULT 0, -- cents
+                created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime'))
+            );
+            """)
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS transactions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                account_id INTEGER NOT NULL,
+                type TEXT NOT NULL, -- "DEPOSIT", "WITHDRAW", "TRANSFER_IN", "TRANSFER_OUT"
+                amount INTEGER NOT NULL, -- cents
+                timestamp TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime')),
+                note TEXT,
+                related_account_id INTEGER,
+                FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE
+            );
+            """)
+            if legacy:
+                # One-time rebuild of databases created with REAL dollar columns.
+                self.conn.execute("""
+                    INSERT INTO accounts (id, name, balance, created_at)
+                    SELECT id, name, CAST(ROUND(balance * 100) AS INTEGER), created_at
+                    FROM accounts_legacy;
+                """)
+                self.conn.execute("""
+                    INSERT INTO transactions (id, account_id, type, amount, timestamp, note, related_account_id)
+                    SELECT id, account_id, type, CAST(ROUND(amount * 100) AS INTEGER), timestamp, note, related_account_id
+                    FROM transactions_legacy;
+                """)
+                self.conn.execute("DROP TABLE transactions_legacy;")
+                self.conn.execute("DROP TABLE accounts_legacy;")
+            # Secondary indexes for the two read paths that would otherwise
+            # full-scan: transaction history (account_id, newest first) and
+            # account search by name.
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tx_acc_id ON transactions(account_id, id DESC);")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_acc_name ON accounts(name COLLATE NOCASE);")
+            # Full-text index over account names: a name search becomes an FTS
+            # lookup instead of a LIKE scan of the whole table. external-content
+            # table, kept in sync by the three triggers below.
+            fts_existed = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='accounts_fts'"
+            ).fetchone() is not None
+            self.conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS accounts_fts
+            USING fts5(name, content='accounts', content_rowid='id');
+            """)
+            self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS accounts_fts_ai AFTER INSERT ON accounts BEGIN
+                INSERT INTO accounts_fts(rowid, name) VALUES (new.id, new.name);
+            END;
+            """)
+            self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS accounts_fts_ad AFTER DELETE ON accounts BEGIN
+                INSERT INTO accounts_fts(accounts_fts, rowid, name) VALUES ('delete', old.id, old.name);
+            END;
+            """)
+            self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS accounts_fts_au AFTER UPDATE OF name ON accounts BEGIN
+                INSERT INTO accounts_fts(accounts_fts, rowid, name) VALUES ('delete', old.id, old.name);
+                INSERT INTO accounts_fts(rowid, name) VALUES (new.id, new.name);
+            END;
+            """)
+            if not fts_existed:
+                # Index pre-existing rows the one time the FTS table is created.
+                self.conn.execute("INSERT INTO accounts_fts(accounts_fts) VALUES ('rebuild');")
+            # Write paths stage the transaction metadata in this temp table and
+            # let the trigger below append the history row inside SQLite when
+            # the balance UPDATE lands: the INSERT never crosses back into
+            # Python, and a rollback discards the staged row along with it.
+            self.conn.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS tx_stage (
+                account_id INTEGER PRIMARY KEY,
+                type TEXT NOT NULL,
+                amount INTEGER NOT NULL, -- cents
+                note TEXT,
+                related_account_id INTEGER
+            );
+            """)
+            self.conn.execute("""
+            CREATE TEMP TRIGGER IF NOT EXISTS log_balance_tx
+            AFTER UPDATE OF balance ON accounts
+            WHEN EXISTS (SELECT 1 FROM tx_stage WHERE account_id = NEW.id)
+            BEGIN
+                INSERT INTO transactions (account_id, type, amount, timestamp, note, related_account_id)
+                SELECT account_id, type, amount,
+                       strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime'),
+                       note, related_account_id
+                FROM tx_stage WHERE account_id = NEW.id;
+                DELETE FROM tx_stage WHERE account_id = NEW.id;
+            END;
+            """)
+
+
+        if os.environ.get("BANKDB_DEBUG"):
+            self._check_query_plans()
+
+    def _check_query_plans(self):
+        # Dev-only guardrail (BANKDB_DEBUG=1): run EXPLAIN QUERY PLAN over
+        # the cached statements and flag any that would full-scan a table,
+        # so a schema change that loses an index is caught at startup.
+        for name, sql in _SQL.items():
+            params = (None,) * sql.count("?")
+            try:
+                plan = self.conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+            except sqlite3.Error:
+                continue
+            for row in plan:
+                detail = row[-1]
+                if "SCAN" in detail and "INDEX" not in detail:
+                    print(f"[BankDB] '{name}' may full-scan: {detail}", file=sys.stderr)
+
+    # --- Account operations ---
+    def create_account(self, name: str, initial_balance: float = 0.0):
+        if not name.strip():
+            raise ValueError("Account name cannot be empty.")
+        if initial_balance < 0:
+            raise ValueError("Initial balance cannot be negative.")
+        cents = to_cents(initial_balance)
+        with self._write_tx():
+            acc_id = self.conn.execute(_SQL["insert_account"], (name.strip(), cents)).fetchone()[0]
+            if cents > 0:
+                self._add_tx(acc_id, "DEPOSIT", cents, "Initial deposit")
+        return acc_id
+
+    def get_account(self, account_id: int):
+        return self.ro.execute(_SQL["get_account"], (account_id,)).fetchone()
+
+    def search_accounts(self, query: str = "", last_id: int = 0, page_size: int = 100):
+        query = query.strip()
+        if not query:
+            return self.ro.execute(_SQL["list_accounts"], (last_id, page_size)).fetchall()
+        acc_id = int(query) if query.isdigit() else -1
+        # Quoted prefix query: the input is matched as a literal token
+        # prefix, never interpreted as FTS5 syntax.
+        match = '"' + query.replace('"', '""') + '"*'
+        return self.ro.execute(
+            _SQL["search_accounts"], (acc_id, last_id, match, last_id, page_size)
+        ).fetchall()
+
+    def delete_account(self, account_id: int):
+        # Deleting an account that still has money is refused by the
+        # balance = 0 guard in the statement itself (optional business
+        # rule); the single statement autocommits under isolation_level=None.
+        if self.conn.execute(_SQL["delete_account"], (account_id,)).fetchone() is None:
+            # Failure path only: one extra lookup to pick the right message.
+            if not self.get_account(account_id):
+                raise ValueError("Account not found.")
+            raise ValueError("Cannot delete account with non-zero balance. Please withdraw/transfer first.")
+
+    # --- Transaction operations ---
+    def deposit(self, account_id: int, amount: float, note: str = ""):
+        if amount <= 0:
+            raise ValueError("Deposit amount must be positive.")
+        cents = to_cents(amount)
+        with self._write_tx():
+            self._stage_tx(account_id, "DEPOSIT", cents, note)
+            row = self.conn.execute(_SQL["credit"], (cents, account_id)).fetchone()
+            if row is None:
+                raise ValueError("Account not found.")
+        return row[0]
+
+    def withdraw(self, account_id: int, amount: float, note: str = ""):
+        if amount <= 0:
+            raise ValueError("Withdrawal amount must be positive.")
+        cents = to_cents(amount)
+        with self._write_tx():
+            self._stage_tx(account_id, "WITHDRAW", cents, note)
+            row = self.conn.execute(_SQL["debit"], (cents, account_id, cents)).fetchone()
+            if row is None:
+                # Failure path only: one extra lookup to pick the right message.
+                if not self.get_account(account_id):
+                    raise ValueError("Account not found.")
+                raise ValueError("Insufficient balance.")
+        return row[0]
+
+    def transfer(self, from_id: int, to_id: int, amount: float, note: str = ""):
+        if from_id == to_id:
+            raise ValueError("Cannot transfer to the same account.")
+        if amount <= 0:
+            raise ValueError("Transfer amount must be positive.")
+        cents = to_cents(amount)
+        with self._write_tx():
+            # Stage both history rows up front; the trigger emits each one
+            # as its balance UPDATE fires.
+            note_val = note.strip() if note else None
+            self.conn.executemany(_SQL["stage_tx"], [
+                (from_id, "TRANSFER_OUT", cents, note_val, to_id),
+                (to_id, "TRANSFER_IN", cents, note_val, from_id),
+            ])
+            row_from = self.conn.execute(_SQL["debit"], (cents, from_id, cents)).fetchone()
+            if row_from is None:
+                if not self.get_account(from_id):
+                    raise ValueError("Source or destination account not found.")
+                raise ValueError("Insufficient balance in source account.")
+            row_to = self.conn.execute(_SQL["credit"], (cents, to_id)).fetchone()
+            if row_to is None:
+                # Rolls back the debit along with the staged history rows.
+                raise ValueError("Source or destination account not found.")
+        return row_from[0], row_to[0]
+
+    def list_transactions(self, account_id: int, limit: int = 50):
+        # Returns the cursor so callers can stream rows (fetchmany) instead
+        # of materializing the whole history in memory.
+        return self.ro.execute(_SQL["list_tx"], (account_id, limit))
+
+    def _add_tx(self, account_id: int, tx_type: str, cents: int, note: str = "", related_account_id: int | None = None):
+        # Direct history insert, for writes that do not touch a balance
+        # (e.g. the initial deposit row in create_account).
+        self.conn.execute(
+            _SQL["insert_tx"],
+            (account_id, tx_type, cents, note.strip() if note else None, related_account_id)
+        )
+
+    def _stage_tx(self, account_id: int, tx_type: str, cents: int, note: str = "", related_account_id: int | None = None):
+        self.conn.execute(
+            _SQL["stage_tx"],
+            (account_id, tx_type, cents, note.strip() if note else None, related_account_id)
+        )
+
+
+# --------------------------
+# GUI layer
+# --------------------------
+class BankApp(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        self.title("Shyam Capital & Finance")
+        self.geometry("960x640")
+        self.db = BankDB()
+
+        # All DB calls go through one worker thread so the Tk event loop
+        # never blocks on disk I/O; results come back via after().
+        self._db_queue = queue.Queue()
+        threading.Thread(target=self._db_worker_loop, daemon=True).start()
+
+        # Notebook (tabs)
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
+
+        self.accounts_tab = ttk.Frame(self.notebook)
+        self.deposit_tab = ttk.Frame(self.notebook)
+        self.withdraw_tab = ttk.Frame(self.notebook)
+        self.transfer_tab = ttk.Frame(self.notebook)
+        self.transactions_tab = ttk.Frame(self.notebook)
+        self.admin_tab = ttk.Frame(self.notebook)
+
+        self.notebook.add(self.accounts_tab, text="Accounts")
+        self.notebook.add(self.deposit_tab, text="Deposit")
+        self.notebook.add(self.withdraw_tab, text="Withdraw")
+        self.notebook.add(self.transfer_tab, text="Transfer")
+        self.notebook.add(self.transactions_tab, text="Transactions")
+
+        # Admin tab is NOT added yet until password is entered
+        self.admin_unlocked = False
+
+        # Build tabs
+        self._setup_accounts_tab()
+        self._setup_deposit_tab()
+        self._setup_withdraw_tab()
+        self._setup_transfer_tab()
+        self._setup_transactions_tab()
+
+        # Status bar
+        self.status_var = tk.StringVar(value="Ready.")
+        self.status_label = tk.Label(self, textvariable=self.status_var, anchor="w",
+                                     relief="sunken", bg="#f0f0f0", padx=8)
+        self.status_label.pack(fill=tk.X, side=tk.BOTTOM)
+
+        # Admin login frame
+        self._setup_admin_login()
+
+    # ---------------- Status utilities ----------------
+    def set_status(self, msg, status="info"):
+        colors = {"info": "#f0f0f0", "success": "#d6f5d6", "warning": "#ffe8b3", "error": "#f9c2c2"}
+        self.status_var.set(msg)
+        self.status_label.config(bg=colors.get(status, "#f0f0f0"))
+
+    # ---------------- DB worker thread ----------------
+    def _db_worker_loop(self):
+        while True:
+            method, args, kwargs, on_done, on_error = self._db_queue.get()
+            try:
+                fn = method if callable(method) else getattr(self.db, method)
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                # Catch everything: an escaping exception would kill this
+                # thread and silently stop all DB actions for good.
+                self.after(0, on_error or self._show_db_error, e)
+            else:
+                if on_done:
+                    self.after(0, on_done, result)
+
+    def db_call(self, method, *args, on_done=None, on_error=None, **kwargs):
+        """Run a BankDB method (by name) or a callable on the worker thread;
+        callbacks fire on the Tk thread."""
+        self._db_queue.put((method, args, kwargs, on_done, on_error))
+
+    def _show_db_error(self, e):
+        messagebox.showerror("Error", str(e))
+
+    # ---------------- Admin Login ----------------
+    def _setup_admin_login(self):
+        login_frame = ttk.LabelFrame(self, text="Admin Login")
+        login_frame.pack(fill=tk.X, padx=8, pady=8)
+
+        ttk.Label(login_frame, text="Enter Admin Password:").grid(row=0, column=0, padx=6, pady=6)
+        self.admin_pass_var = tk.StringVar()
+        ttk.Entry(login_frame, textvariable=self.admin_pass_var, show="*").grid(row=0, column=1, padx=6, pady=6)
+        ttk.Button(login_frame, text="Unlock Admin", command=self.unlock_admin).grid(row=0, column=2, padx=6, pady=6)
+
+    def unlock_admin(self):
+        if self.admin_pass_var.get() == ADMIN_PASSWORD:
+            if not self.admin_unlocked:
+                self.notebook.add(self.admin_tab, text="Admin")
+                self._setup_admin_tab()
+                self.admin_unlocked = True
+                self.set_status("Admin tab unlocked successfully.", "success")
+        else:
+            self.set_status("Incorrect password. Access denied.", "error")
+
+
+    # ---------------- Accounts Tab ----------------
+    def _setup_accounts_tab(self):
+        frm = self.accounts_tab
+
+        # Create account
+        create_frame = ttk.LabelFrame(frm, text="Create account")
+        create_frame.pack(fill=tk.X, padx=8, pady=8)
+
+        ttk.Label(create_frame, text="Name:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
+        self.acc_name_var = tk.StringVar()
+        ttk.Entry(create_frame, textvariable=self.acc_name_var, width=30).grid(row=0, column=1, padx=6, pady=6)
+
+        ttk.Label(create_frame, text="Initial balance:").grid(row=0, column=2, padx=6, pady=6, sticky="w")
+        self.acc_init_var = tk.StringVar(value="0")
+        ttk.Entry(create_frame, textvariable=self.acc_init_var, width=15).grid(row=0, column=3, padx=6, pady=6)
+
+        ttk.Button(create_frame, text="Create", command=self.create_account).grid(row=0, column=4, padx=6, pady=6)
+
+        # Search and list
+        list_frame = ttk.LabelFrame(frm, text="Accounts list")
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
+
+        top_bar = tk.Frame(list_frame)
+        top_bar.pack(fill=tk.X, padx=6, pady=4)
+        ttk.Label(top_bar, text="Search:").pack(side=tk.LEFT, padx=4)
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(top_bar, textvariable=self.search_var, width=30)
+        search_entry.pack(side=tk.LEFT, padx=4)
+        # Search-as-you-type, debounced so a burst of keystrokes runs one
+        # query instead of one per key.
+        self._search_after_id = None
+        search_entry.bind("<KeyRelease>", self._on_search_typed)
+        ttk.Button(top_bar, text="Find", command=self.refresh_accounts).pack(side=tk.LEFT, padx=4)
+        ttk.Button(top_bar, text="Refresh", command=lambda: self.refresh_accounts(True)).pack(side=tk.LEFT, padx=4)
+        ttk.Button(top_bar, text="Next >", command=self.next_accounts_page).pack(side=tk.RIGHT, padx=4)
+        ttk.Button(top_bar, text="< Prev", command=self.prev_accounts_page).pack(side=tk.RIGHT, padx=4)
+
+        # Keyset pagination state: stack of "last id seen" cursors, one per
+        # page, so Prev/Next never need OFFSET.
+        self.accounts_page_size = 100
+        self._acc_page_stack = [0]
+        # Filled in by _populate_accounts; start empty so Prev/Next clicked
+        # before the first (async) page arrives are no-ops.
+        self._acc_page_rows = 0
+        self._acc_page_max_id = None
+
+        columns = ("id", "name", "balance", "created_at")
+        self.accounts_tree = ttk.Treeview(list_frame, columns=columns, show="headings", height=12)
+        for col, text, w in [
+            ("id", "ID", 80),
+            ("name", "Name", 240),
+            ("balance", "Balance", 140),
+            ("created_at", "Created at", 200),
+        ]:
+            self.accounts_tree.heading(col, text=text)
+            self.accounts_tree.column(col, width=w, anchor=tk.CENTER)
+        self.accounts_tree.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
+
+        self.refresh_accounts(True)
+
+    def create_account(self):
+        name = self.acc_name_var.get().strip()
+        initial = self.acc_init_var.get().strip()
+        try:
+            initial_value = float(initial) if initial else 0.0
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        def done(acc_id):
+            messagebox.showinfo("Success", f"Account created (ID: {acc_id})")
+            self.acc_name_var.set("")
+            self.acc_init_var.set("0")
+            self.refresh_accounts(True)
+
+        self.db_call("create_account", name, initial_value, on_done=done)
+
+    def _on_search_typed(self, _event=None):
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(200, self._run_search)
+
+    def _run_search(self):
+        self._search_after_id = None
+        self.refresh_accounts()
+
+    def refresh_accounts(self, clear_search=False, keep_page=False):
+        if clear_search:
+            self.search_var.set("")
+        if not keep_page:
+            self._acc_page_stack = [0]
+        query = self.search_var.get().strip()
+        self.db_call("search_accounts", query, last_id=self._acc_page_stack[-1],
+                     page_size=self.accounts_page_size, on_done=self._populate_accounts)
+
+    def _populate_accounts(self, rows):
+        tree = self.accounts_tree
+        tree.delete(*tree.get_children())
+        # Call straight into Tcl: skips ttk's per-row option formatting,
+        # which dominates refresh time for hundreds of rows.
+        tree_call = tree.tk.call
+        for r in rows:
+            tree_call(tree._w, "insert", "", "end", "-values",
+                      (str(r[0]), r[1], fmt_money(r[2]), r[3]))
+        self._acc_page_rows = len(rows)
+        self._acc_page_max_id = rows[-1][0] if rows else None
+
+    def next_accounts_page(self):
+        if self._acc_page_rows < self.accounts_page_size or self._acc_page_max_id is None:
+            return  # already on the last page
+        self._acc_page_stack.append(self._acc_page_max_id)
+        self.refresh_accounts(keep_page=True)
+
+    def prev_accounts_page(self):
+        if len(self._acc_page_stack) > 1:
+            self._acc_page_stack.pop()
+            self.refresh_accounts(keep_page=True)
+
+    # ---------------- Deposit Tab ----------------
+    def _setup_deposit_tab(self):
+        frm = self.deposit_tab
+        box = ttk.LabelFrame(frm, text="Deposit")
+        box.pack(fill=tk.X, padx=8, pady=8)
+
+        self.dep_acc_var = tk.StringVar()
+        self.dep_amt_var = tk.StringVar()
+        self.dep_note_var = tk.StringVar()
+
+        ttk.Label(box, text="Account ID:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
+        ttk.Entry(box, textvariable=self.dep_acc_var, width=12).grid(row=0, column=1, padx=6, pady=6)
+        ttk.Label(box, text="Amount:").grid(row=0, column=2, padx=6, pady=6, sticky="w")
+        ttk.Entry(box, textvariable=self.dep_amt_var, width=12).grid(row=0, column=3, padx=6, pady=6)
+        ttk.Label(box, text="Note:").grid(row=0, column=4, padx=6, pady=6, sticky="w")
+        ttk.Entry(box, textvariable=self.dep_note_var, width=30).grid(row=0, column=5, padx=6, pady=6)
+
+        ttk.Button(box, text="Deposit", command=self.do_deposit).grid(row=0, column=6, padx=8, pady=6)
+
+    def do_deposit(self):
+        try:
+            acc_id = int(self.dep_acc_var.get())
+            amt = float(self.dep_amt_var.get())
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        note = self.dep_note_var.get()
+
+        def done(new_bal):
+            messagebox.showinfo("Success", f"Deposited {amt:.2f}. New balance: {fmt_money(new_bal)}")
+            self.dep_amt_var.set("")
+            self.dep_note_var.set("")
+            self.refresh_accounts(True)
+
+        self.db_call("deposit", acc_id, amt, note, on_done=done)
+
+    # ---------------- Withdraw Tab ----------------
+    def _setup_withdraw_tab(self):
+        frm = self.withdraw_tab
+        box = ttk.LabelFrame(frm, text="Withdraw")
+        box.pack(fill=tk.X, padx=8, pady=8)
+
+        self.wd_acc_var = tk.StringVar()
+        self.wd_amt_var = tk.StringVar()
+        self.wd_note_var = tk.StringVar()
+
+        ttk.Label(box, text="Account ID:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
+        ttk.Entry(box, textvariable=self.wd_acc_var, width=12).grid(row=0, column=1, padx=6, pady=6)
+        ttk.Label(box, text="Amount:").grid(row=0, column=2, padx=6, pady=6, sticky="w")
+        ttk.Entry(box, textvariable=self.wd_amt_var, width=12).grid(row=0, column=3, padx=6, pady=6)
+        ttk.Label(box, text="Note:").grid(row=0, column=4, padx=6, pady=6, sticky="w")
+        ttk.Entry(box, textvariable=self.wd_note_var, width=30).grid(row=0, column=5, padx=6, pady=6)
+
+        ttk.Button(box, text="Withdraw", command=self.do_withdraw).grid(row=0, column=6, padx=8, pady=6)
+
+    def do_withdraw(self):
+        try:
+            acc_id = int(self.wd_acc_var.get())
+            amt = float(self.wd_amt_var.get())
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        note = self.wd_note_var.get()
+
+        def done(new_bal):
+            messagebox.showinfo("Success", f"Withdrew {amt:.2f}. New balance: {fmt_money(new_bal)}")
+            self.wd_amt_var.set("")
+            self.wd_note_var.set("")
+            self.refresh_accounts(True)
+
+        self.db_call("withdraw", acc_id, amt, note, on_done=done)
+
+    # ---------------- Transfer Tab ----------------
+    def _setup_transfer_tab(self):
+        frm = self.transfer_tab
+        box = ttk.LabelFrame(frm, text="Transfer")
+        box.pack(fill=tk.X, padx=8, pady=8)
+
+        self.tf_from_var = tk.StringVar()
+        self.tf_to_var = tk.StringVar()
+        self.tf_amt_var = tk.StringVar()
+        self.tf_note_var = tk.StringVar()
+
+        ttk.Label(box, text="From Account ID:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
+        ttk.Entry(box, textvariable=self.tf_from_var, width=12).grid(row=0, column=1, padx=6, pady=6)
+        ttk.Label(box, text="To Account ID:").grid(row=0, column=2, padx=6, pady=6, sticky="w")
+        ttk.Entry(box, textvariable=self.tf_to_var, width=12).grid(row=0, column=3, padx=6, pady=6)
+        ttk.Label(box, text="Amount:").grid(row=0, column=4, padx=6, pady=6, sticky="w")
+        ttk.Entry(box, textvariable=self.tf_amt_var, width=12).grid(row=0, column=5, padx=6, pady=6)
+        ttk.Label(box, text="Note:").grid(row=0, column=6, padx=6, pady=6, sticky="w")
+        ttk.Entry(box, textvariable=self.tf_note_var, width=24).grid(row=0, column=7, padx=6, pady=6)
+
+        ttk.Button(box, text="Transfer", command=self.do_transfer).grid(row=0, column=8, padx=8, pady=6)
+
+    def do_transfer(self):
+        try:
+            from_id = int(self.tf_from_var.get())
+            to_id = int(self.tf_to_var.get())
+            amt = float(self.tf_amt_var.get())
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        note = self.tf_note_var.get()
+
+        def done(balances):
+            new_from, new_to = balances
+            messagebox.showinfo("Success", f"Transferred {amt:.2f}. From new balance: {fmt_money(new_from)}, To new balance: {fmt_money(new_to)}")
+            self.tf_amt_var.set("")
+            self.tf_note_var.set("")
+            self.refresh_accounts(True)
+
+        self.db_call("transfer", from_id, to_id, amt, note, on_done=done)
+
+    # ---------------- Transactions Tab ----------------
+    def _setup_transactions_tab(self):
+        frm = self.transactions_tab
+        box = ttk.LabelFrame(frm, text="Transaction history")
+        box.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
+
+        top = tk.Frame(box)
+        top.pack(fill=tk.X, padx=6, pady=6)
+
+        self.tx_acc_var = tk.StringVar()
+        self.tx_limit_var = tk.StringVar(value="50")
+
+        ttk.Label(top, text="Account ID:").pack(side=tk.LEFT, padx=4)
+        ttk.Entry(top, textvariable=self.tx_acc_var, width=12).pack(side=tk.LEFT, padx=4)
+        ttk.Label(top, text="Limit:").pack(side=tk.LEFT, padx=4)
+        ttk.Entry(top, textvariable=self.tx_limit_var, width=6).pack(side=tk.LEFT, padx=4)
+        ttk.Button(top, text="Load", command=self.load_transactions).pack(side=tk.LEFT, padx=6)
+
+        columns = ("id", "type", "amount", "timestamp", "note", "related")
+        self.tx_tree = ttk.Treeview(box, columns=columns, show="headings", height=16)
+        headings = [
+            ("id", "ID", 80),
+            ("type", "Type", 120),
+            ("amount", "Amount", 120),
+            ("timestamp", "Timestamp", 180),
+            ("note", "Note", 240),
+            ("related", "Related Acc", 120),
+        ]
+        for col, text, w in headings:
+            self.tx_tree.heading(col, text=text)
+            self.tx_tree.column(col, width=w, anchor=tk.CENTER)
+        self.tx_tree.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
+
+    def load_transactions(self):
+        try:
+            acc_id = int(self.tx_acc_var.get())
+            limit = int(self.tx_limit_var.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid Account ID and Limit.")
+            return
+        self.tx_tree.delete(*self.tx_tree.get_children())
+        # Generation counter: a newer Load discards batches still in flight
+        # from the previous one.
+        self._tx_load_gen = getattr(self, "_tx_load_gen", 0) + 1
+        self.db_call(self._stream_transactions, acc_id, limit, self._tx_load_gen)
+
+    def _stream_transactions(self, acc_id, limit, gen):
+        # Runs on the DB worker thread, so the cursor is drained on the
+        # same thread that owns the connections; the Tk thread only ever
+        # sees plain row batches posted via after().
+        cur = self.db.list_transactions(acc_id, limit)
+        while True:
+            batch = cur.fetchmany(200)
+            if not batch:
+                break
+            self.after(0, self._append_tx_batch, batch, gen)
+
+    def _append_tx_batch(self, batch, gen):
+        if gen != self._tx_load_gen:
+            return
+        tree = self.tx_tree
+        tree_call = tree.tk.call
+        for r in batch:
+            tree_call(tree._w, "insert", "", "end", "-values",
+                      (str(r[0]), r[1], fmt_money(r[2]), r[3], str(r[4]), str(r[5])))
+
+    # ---------------- Admin Tab ----------------
+    def _setup_admin_tab(self):
+        frm = self.admin_tab
+        box = ttk.LabelFrame(frm, text="Admin operations")
+        box.pack(fill=tk.X, padx=8, pady=8)
+
+        self.del_acc_var = tk.StringVar()
+
+        ttk.Label(box, text="Delete Account ID:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
+        ttk.Entry(box, textvariable=self.del_acc_var, width=12).grid(row=0, column=1, padx=6, pady=6)
+        ttk.Button(box, text="Delete", command=self.delete_account).grid(row=0, column=2, padx=8, pady=6)
+
+        # Quick balances checker
+        bal_box = ttk.LabelFrame(frm, text="Quick balance check")
+        bal_box.pack(fill=tk.X, padx=8, pady=8)
+        self.bal_acc_var = tk.StringVar()
+        ttk.Label(bal_box, text="Account ID:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
+        ttk.Entry(bal_box, textvariable=self.bal_acc_var, width=12).grid(row=0, column=1, padx=6, pady=6)
+        ttk.Button(bal_box, text="Check", command=self.check_balance).grid(row=0, column=2, padx=8, pady=6)
+
+    def delete_account(self):
+        try:
+            acc_id = int(self.del_acc_var.get())
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        # Confirm
+        if not messagebox.askyesno("Confirm", f"Delete account {acc_id}? (Requires zero balance)"):
+            return
+
+        def done(_):
+            messagebox.showinfo("Deleted", f"Account {acc_id} deleted.")
+            self.del_acc_var.set("")
+            self.refresh_accounts(True)
+
+        self.db_call("delete_account", acc_id, on_done=done)
+
+    def check_balance(self):
+        try:
+            acc_id = int(self.bal_acc_var.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid Account ID.")
+            return
+
+        def done(acc):
+            if not acc:
+                messagebox.showerror("Not found", "Account not found.")
+                return
+            messagebox.showinfo("Balance", f"Account {acc[0]} ({acc[1]}) balance: {fmt_money(acc[2])}")
+
+        self.db_call("get_account", acc_id, on_done=done)
+
+
+# --------------------------
+# Run app
+# --------------------------
+if __name__ == "__main__":
+    app = BankApp()
+    app.mainloop()